@@ -4,37 +4,132 @@ Automated creation of AI-friendly documentation files
 """
 
 import argparse
+import diskcache
+import hashlib
+import multiprocessing
 import os
+import queue
 import re
 import requests
+import requests_cache
+import string
+import threading
 import time
-from bs4 import BeautifulSoup
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin, urlparse, urlunparse
+from urllib.robotparser import RobotFileParser
+from lxml import etree, html as lxml_html
 from markdownify import markdownify as md
+from pybloom_live import ScalableBloomFilter
 from tqdm import tqdm
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Set, TextIO, Tuple
+
+# The same URLs are validated, normalized and named repeatedly; parse each only once
+_parse_url = lru_cache(maxsize=65536)(urlparse)
+
+class _ThrottledAdapter(HTTPAdapter):
+    """HTTPAdapter that waits for the host's rate-limit slot before going to the network"""
+
+    def __init__(self, throttle, **kwargs):
+        self._throttle = throttle
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        # requests-cache answers cache hits before reaching the adapter, so they skip this
+        self._throttle(_parse_url(request.url).netloc)
+        return super().send(request, **kwargs)
 
 class LLMsGenerator:
+    _SANITIZE_RE = re.compile(r'[^a-zA-Z0-9-]')
+    _DIGITS_RE = re.compile(r'\d+')
+    _SLASHES_RE = re.compile(r'/{2,}')
+    _PERCENT_RE = re.compile(r'%([0-9A-Fa-f]{2})')
+    _UNRESERVED = frozenset(string.ascii_letters + string.digits + '-._~')
+    _DEFAULT_PORTS = {'http': 80, 'https': 443}
+    _HTML_TYPES = ('text/html', 'application/xhtml')
+    _MAX_BYTES = 4_000_000
+    _HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+    # Bump whenever _parse_page's output changes so cached conversions are not reused
+    _CONVERSION_VERSION = 1
+    _NON_CONTENT_TAGS = ('nav', 'header', 'footer', 'script', 'style', 'noscript')
+    _BAD_EXT = frozenset({
+        'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg', 'ico', 'pdf', 'zip', 'gz',
+        'css', 'js', 'json', 'xml', 'mp3', 'mp4', 'webm', 'woff', 'woff2', 'ttf'
+    })
+
     def __init__(self, base_url: str, output_dir: str = './output', 
-                 ignore_paths: List[str] = None, delay: float = 1.0):
+                 ignore_paths: List[str] = None, delay: float = 1.0,
+                 workers: int = 10, cache: bool = True):
         self.base_url = base_url.rstrip('/')
         self.output_dir = output_dir
-        self.ignore_paths = set(ignore_paths or [])
+        self.md_dir = os.path.join(output_dir, 'markdown')
+        self.ignore_paths = tuple(set(ignore_paths or []))
         self.delay = delay
-        self.visited_urls: Set[str] = set()
+        self.workers = workers
+        # ~10 bits per URL instead of a full string; a false positive skips a page
+        self.visited_urls = ScalableBloomFilter(initial_capacity=100_000, error_rate=1e-6)
         self.site_data: List[Dict] = []
-        self.domain = urlparse(base_url).netloc
+        self.content_sigs: Set[bytes] = set()
+        self.domain = _parse_url(base_url).netloc
+        self.netloc = self._normalize_netloc(_parse_url(base_url))
+
+        # Reuse keep-alive connections across every page of the site. With caching on,
+        # responses persist between runs and are revalidated via ETag/Last-Modified.
+        if cache:
+            self.session = requests_cache.CachedSession(
+                cache_name=os.path.join(output_dir, '.http_cache'),
+                backend='sqlite', expire_after=86400, filter_fn=self._is_cacheable)
+            # Converted pages keyed by (version, url, HTML digest) skip parsing on re-runs
+            self._md_cache = diskcache.Cache(os.path.join(output_dir, '.md_cache'))
+        else:
+            self.session = requests.Session()
+            self._md_cache = None
+        self.session.headers.update({
+            'User-Agent': 'LLMs.txt Generator/1.0 (+https://github.com/llms-txt/generator)'
+        })
+        adapter = _ThrottledAdapter(self._wait_for_slot, pool_connections=50, pool_maxsize=50,
+                                    max_retries=Retry(total=3, backoff_factor=0.3))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # robots.txt rules per origin; the host's Crawl-delay overrides `delay` if longer
+        self._robots: Dict[str, RobotFileParser] = {}
+        self._host_delays: Dict[str, float] = {}
+
+        # Shared across fetch workers so each host's delay spaces out all its requests
+        self._rate_lock = threading.Lock()
+        self._next_request_at: Dict[str, float] = {}
+
+        # Markdown files are written off the crawl loop by a background thread
+        self._writer_q: queue.Queue = queue.Queue()
+        # llms-full.txt, open while generate() crawls so each page is appended once processed
+        self._llms_full: Optional[TextIO] = None
+
+    def _is_cacheable(self, response: requests.Response) -> bool:
+        """Only cache HTML pages that don't declare a size over _MAX_BYTES"""
+        # Called on headers alone; rejecting here keeps the body streamed and unread.
+        # Chunked responses carry no Content-Length and are cached.
+        content_type = response.headers.get('Content-Type', '').lower()
+        length = response.headers.get('Content-Length', '')
+        return (
+            content_type.startswith(self._HTML_TYPES) and
+            not (length.isdigit() and int(length) > self._MAX_BYTES)
+        )
 
     def _sanitize_filename(self, url: str) -> str:
         """Convert URL to filesystem-safe name without trailing underscores"""
-        parsed = urlparse(url)
+        parsed = _parse_url(url)
         path = parsed.path.strip('/')  # Remove leading/trailing slashes
         
         if not path:  # Handle root URL
             return 'index.md'
         
         # Replace special characters with hyphens
-        safe_name = re.sub(r'[^a-zA-Z0-9-]', '-', path)
+        safe_name = self._SANITIZE_RE.sub('-', path)
         
         # Remove trailing underscores/hyphens
         safe_name = safe_name.rstrip('-_')
@@ -43,21 +138,102 @@ class LLMsGenerator:
 
     def _is_valid_url(self, url: str) -> bool:
         """Validate URLs for processing"""
-        parsed = urlparse(url)
+        parsed = _parse_url(url)
         return (
-            parsed.netloc == self.domain and
-            not any(url.startswith(p) for p in self.ignore_paths) and
-            parsed.path.split('.')[-1] not in {'png', 'jpg', 'pdf', 'css', 'js'}
+            self._normalize_netloc(parsed) == self.netloc and
+            not url.startswith(self.ignore_paths) and
+            os.path.splitext(parsed.path)[1][1:].lower() not in self._BAD_EXT and
+            self._robots_for(parsed).can_fetch(self.session.headers['User-Agent'], url)
         )
+
+    def _robots_for(self, parsed) -> RobotFileParser:
+        """Load and cache robots.txt for the URL's origin"""
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        robots = self._robots.get(origin)
+        if robots is not None:
+            return robots
+
+        robots = RobotFileParser(f"{origin}/robots.txt")
+        lines: List[str] = []
+        try:
+            response = self.session.get(robots.url, timeout=10)
+            if response.status_code in (401, 403):
+                robots.disallow_all = True
+            elif response.status_code >= 400:
+                robots.allow_all = True
+            else:
+                lines = response.text.splitlines()
+                robots.parse(lines)
+        except requests.RequestException:
+            robots.allow_all = True
+
+        crawl_delay = self._crawl_delay(lines)
+        self._host_delays[parsed.netloc] = max(self.delay, crawl_delay or 0.0)
+        self._robots[origin] = robots
+        return robots
     
+    def _crawl_delay(self, lines: List[str]) -> Optional[float]:
+        """Crawl-delay for our user agent, else for *, allowing fractional seconds"""
+        # RobotFileParser.crawl_delay() only understands whole seconds
+        agent_token = self.session.headers['User-Agent'].split('/')[0].lower()
+        delays: Dict[str, float] = {}
+        agents: List[str] = []
+        in_rules = False
+        for line in lines:
+            key, sep, value = line.split('#', 1)[0].partition(':')
+            if not sep:
+                continue
+            key, value = key.strip().lower(), value.strip()
+            if key == 'user-agent':
+                if in_rules:  # A user-agent line after rules starts a new group
+                    agents, in_rules = [], False
+                agents.append(value.lower())
+                continue
+
+            in_rules = True
+            if key != 'crawl-delay':
+                continue
+            try:
+                delay = float(value)
+            except ValueError:
+                continue
+            if not 0 <= delay < float('inf'):
+                continue
+            for agent in agents:
+                # Same matching as RobotFileParser: agent name is a substring of our token
+                if agent == '*':
+                    delays.setdefault('*', delay)
+                elif agent in agent_token:
+                    delays.setdefault('self', delay)
+        return delays.get('self', delays.get('*'))
+
+    def _normalize_netloc(self, parsed) -> str:
+        """Lowercase the host and drop a leading www. and any default port"""
+        host = (parsed.hostname or '').removeprefix('www.')
+        try:
+            port = parsed.port
+        except ValueError:  # Malformed port in a scraped href
+            port = None
+        if port and port != self._DEFAULT_PORTS.get(parsed.scheme.lower()):
+            return f"{host}:{port}"
+        return host
+
+    def _decode_unreserved(self, match: re.Match) -> str:
+        """Decode %XX only when it encodes an unreserved character"""
+        char = chr(int(match.group(1), 16))
+        return char if char in self._UNRESERVED else match.group(0).upper()
+
     def _normalize_url(self, url: str) -> str:
         """Standardize URL format"""
-        parsed = urlparse(url)
+        parsed = _parse_url(url)
+        # Collapse duplicate slashes and decode needlessly escaped characters
+        path = self._SLASHES_RE.sub('/', parsed.path)
+        path = self._PERCENT_RE.sub(self._decode_unreserved, path)
         # Remove fragments/query params and enforce trailing slash
-        clean_path = parsed.path.rstrip('/') + '/'
+        clean_path = path.rstrip('/') + '/'
         return urlunparse((
-            parsed.scheme,
-            parsed.netloc,
+            parsed.scheme.lower(),
+            self._normalize_netloc(parsed),
             clean_path,
             '', '', ''
         ))
@@ -67,130 +243,250 @@ class LLMsGenerator:
         normalized = self._normalize_url(url)
         return normalized not in self.visited_urls
 
-    def _clean_html(self, soup: BeautifulSoup) -> BeautifulSoup:
+    @staticmethod
+    def _clean_html(tree: lxml_html.HtmlElement) -> lxml_html.HtmlElement:
         """Remove non-content elements"""
-        for element in soup(['nav', 'header', 'footer', 'script', 'style']):
-            element.decompose()
-        return soup
+        # Single C-level pass; with_tail=False keeps the text that follows each element
+        etree.strip_elements(tree, *LLMsGenerator._NON_CONTENT_TAGS, with_tail=False)
+        return tree
+
+    def _wait_for_slot(self, host: str):
+        """Block until the host's delay has passed since its last request started"""
+        delay = self._host_delays.get(host, self.delay)
+        with self._rate_lock:
+            now = time.monotonic()
+            next_at = self._next_request_at.get(host, 0.0)
+            self._next_request_at[host] = max(now, next_at) + delay
+        wait_for = next_at - now
+        if wait_for > 0:
+            time.sleep(wait_for)
 
     def _fetch_page(self, url: str) -> str:
-        """Fetch page content with rate limiting"""
-        time.sleep(self.delay)
+        """Fetch page content; the session's adapter applies rate limiting"""
         try:
-            response = requests.get(url, timeout=10, headers={
-                'User-Agent': 'LLMs.txt Generator/1.0 (+https://github.com/llms-txt/generator)'
-            })
-            response.raise_for_status()
-            return response.text
+            with self.session.get(url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                # Don't download bodies we can't convert
+                content_type = response.headers.get('Content-Type', '').lower()
+                if not content_type.startswith(self._HTML_TYPES):
+                    return ""
+                body = response.raw.read(self._MAX_BYTES + 1, decode_content=True)
+                if len(body) > self._MAX_BYTES:
+                    print(f"\n⚠️ Skipping {url}: larger than {self._MAX_BYTES} bytes")
+                    return ""
+                # Fall back to UTF-8 instead of letting requests sniff the charset
+                encoding = response.encoding if 'charset' in content_type else 'utf-8'
+                return body.decode(encoding, errors='replace')
         except Exception as e:
             print(f"\n⚠️ Error fetching {url}: {str(e)}")
             return ""
 
-    def _convert_to_markdown(self, html: str, url: str) -> str:
-        """Convert HTML to clean markdown"""
-        soup = BeautifulSoup(html, 'html.parser')
-        soup = self._clean_html(soup)
+    @staticmethod
+    def _convert_to_markdown(tree: lxml_html.HtmlElement, title: str) -> str:
+        """Convert parsed HTML to clean markdown"""
+        tree = LLMsGenerator._clean_html(tree)
         
         # Create markdown header
-        title = soup.title.string.strip() if soup.title else url
         header = f"# {title}\n\n"
         
         # Convert main content
-        main_content = soup.find('main') or soup.body
-        return header + md(str(main_content)) if main_content else ""
-
-    def _crawl(self, url: str):
-        """Recursive crawler with progress tracking"""
+        main_content = tree.find('.//main')
+        if main_content is None:
+            main_content = tree.find('body')
+        if main_content is None:
+            return ""
+        # Serialize only the content subtree with lxml's C serializer
+        content = lxml_html.tostring(main_content, encoding='unicode', with_tail=False)
+        return header + md(content, heading_style='ATX', strip=['img'])
 
-        normalized_url = self._normalize_url(url)
-    
-        if not self._is_new_page(normalized_url):
-            return
-    
-        self.visited_urls.add(normalized_url)
+    @staticmethod
+    def _parse_page(html: str, url: str) -> Tuple[str, Optional[str], str, List[str]]:
+        """Parse HTML into (markdown, title, description, hrefs) in a worker process"""
+        try:
+            # Parse bytes so documents with an XML encoding declaration are accepted
+            tree = lxml_html.document_fromstring(html.encode('utf-8'),
+                                                 parser=LLMsGenerator._HTML_PARSER)
+        except etree.ParserError:  # Empty document
+            return "", None, "", []
+        title = (tree.findtext('head/title') or '').strip() or None
+        meta = tree.xpath('//meta[@name="description"]/@content', smart_strings=False)
+        description = meta[0] if meta else ""
+        # Collect links before _clean_html strips nav/header/footer
+        hrefs = tree.xpath('//a/@href', smart_strings=False)
 
-        # url = normalized_url
+        markdown = LLMsGenerator._convert_to_markdown(tree, title or url)
+        return markdown, title, description, hrefs
 
+    def _fetch_and_parse(self, url: str, parse_pool: ProcessPoolExecutor) -> Optional[Tuple]:
+        """Fetch a page on this thread and hand its HTML to the parse pool"""
         html = self._fetch_page(url)
         if not html:
-            return
+            return None
+        if self._md_cache is None:
+            return parse_pool.submit(self._parse_page, html, url).result()
+
+        key = (self._CONVERSION_VERSION, url, hashlib.blake2b(html.encode()).hexdigest())
+        parsed = self._md_cache.get(key)
+        if parsed is None:
+            parsed = parse_pool.submit(self._parse_page, html, url).result()
+            self._md_cache.set(key, parsed)
+        return parsed
+
+    def _process_page(self, url: str, parsed: Tuple) -> List[str]:
+        """Save a parsed page and return the crawlable links it contains"""
+        markdown, title, description, hrefs = parsed
+        links = self._extract_links(url, hrefs)
+
+        # Skip templated duplicates (pagination, tag pages) that differ only by numbers
+        sig = hashlib.blake2b(self._DIGITS_RE.sub('', markdown).encode(), digest_size=8).digest()
+        if sig in self.content_sigs:
+            return links
+        self.content_sigs.add(sig)
 
-        markdown = self._convert_to_markdown(html, url)
         filename = self._sanitize_filename(url)
         
         # Save individual .html.md file
-        md_dir = os.path.join(self.output_dir, 'markdown')
-        os.makedirs(md_dir, exist_ok=True)
-        with open(os.path.join(md_dir, filename), 'w', encoding='utf-8') as f:
-            f.write(markdown)
+        self._writer_q.put((os.path.join(self.md_dir, filename), markdown))
 
         self.site_data.append({
             'url': url,
             'md_path': filename,  # Remove "markdown/" prefix
-            'title': BeautifulSoup(html, 'html.parser').title.string.strip() if BeautifulSoup(html, 'html.parser').title else filename,
-            'description': (BeautifulSoup(html, 'html.parser')
-                            .find('meta', attrs={'name': 'description'})['content'] 
-                            if BeautifulSoup(html, 'html.parser').find('meta', attrs={'name': 'description'}) 
-                            else "")
+            'title': title or filename,
+            'description': description
         })
+        # Stream into llms-full.txt instead of keeping every page's markdown in memory
+        self._llms_full.write(f"# {title or filename}\n\n{markdown}\n\n---\n\n")
+        return links
+
+    def _write_files(self):
+        """Write queued markdown files until the None sentinel arrives"""
+        while True:
+            item = self._writer_q.get()
+            if item is None:
+                return
+            path, data = item
+            try:
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(data)
+            except OSError as e:
+                print(f"\n⚠️ Error writing {path}: {str(e)}")
 
-        # Find and process links
-        soup = BeautifulSoup(html, 'html.parser')
-        for link in tqdm(soup.find_all('a', href=True), desc=f"Processing links from {url}"):
-            absolute_url = urljoin(url, link['href'])
+    def _extract_links(self, url: str, hrefs: List[str]) -> List[str]:
+        """Resolve hrefs against the page URL and keep the crawlable ones"""
+        links = []
+        for href in hrefs:
+            absolute_url = urljoin(url, href)
             if self._is_valid_url(absolute_url):
-                self._crawl(absolute_url)
+                links.append(absolute_url)
+        return links
+
+    def _crawl(self, start_url: str):
+        """Breadth-first crawler: pages are fetched on a thread pool and parsed here"""
+        # The start URL obeys robots.txt too; this also loads Crawl-delay before the first fetch
+        robots = self._robots_for(_parse_url(start_url))
+        if not robots.can_fetch(self.session.headers['User-Agent'], start_url):
+            print(f"\n⚠️ robots.txt disallows crawling {start_url}")
+            return
+
+        frontier = deque()
+        in_flight = deque()
+        # One bar for the whole crawl: pages done out of pages discovered so far
+        pbar = tqdm(total=0, desc='Crawling', unit='page')
+
+        def enqueue(url: str):
+            normalized_url = self._normalize_url(url)
+            if not self._is_new_page(normalized_url):
+                return
+            self.visited_urls.add(normalized_url)
+            frontier.append(url)
+            pbar.total += 1
+
+        enqueue(start_url)
+        writer = threading.Thread(target=self._write_files, daemon=True)
+        writer.start()
+        try:
+            # Threads wait on the network; parsing and conversion run on every CPU core.
+            # Parse workers must not be fork()ed from this process once its fetch and
+            # writer threads are running, so start them from a clean interpreter.
+            start_method = ('forkserver' if 'forkserver' in multiprocessing.get_all_start_methods()
+                            else 'spawn')
+            mp_context = multiprocessing.get_context(start_method)
+            with ThreadPoolExecutor(max_workers=self.workers) as pool, \
+                    ProcessPoolExecutor(mp_context=mp_context) as parse_pool:
+                while frontier or in_flight:
+                    # Keep one running fetch per worker; finished ones waiting to be
+                    # processed don't count, so a slow page never stalls new fetches
+                    running = sum(not future.done() for _, future in in_flight)
+                    while frontier and running < self.workers:
+                        url = frontier.popleft()
+                        in_flight.append((url, pool.submit(self._fetch_and_parse, url, parse_pool)))
+                        running += 1
+
+                    if not in_flight[0][1].done():
+                        wait([future for _, future in in_flight if not future.done()],
+                             return_when=FIRST_COMPLETED)
+
+                    # Pages are processed in discovery order even when fetches finish out of
+                    # order, so output order and duplicate choice match a serial crawl
+                    while in_flight and in_flight[0][1].done():
+                        url, future = in_flight.popleft()
+                        parsed = future.result()
+                        if parsed:
+                            for link in self._process_page(url, parsed):
+                                enqueue(link)
+                        pbar.set_postfix_str(url[-40:], refresh=False)
+                        pbar.update(1)
+        finally:
+            pbar.close()
+            # Flush pending file writes before the outputs are assembled
+            self._writer_q.put(None)
+            writer.join()
 
     def generate(self):
         """Main generation workflow"""
         print(f"🚀 Starting LLMs.txt generation for {self.base_url}")
         os.makedirs(self.output_dir, exist_ok=True)
+        os.makedirs(self.md_dir, exist_ok=True)
         
-        # Start crawling
-        self._crawl(self.base_url)
+        try:
+            # Start crawling; pages are appended to llms-full.txt in discovery order
+            with open(os.path.join(self.output_dir, 'llms-full.txt'), 'w',
+                      encoding='utf-8', buffering=1 << 20) as llms_full:
+                self._llms_full = llms_full
+                self._crawl(self.base_url)
+            self._llms_full = None
         
-        # Generate llms.txt
-        core_docs = []
-        optional_docs = []
-        for page in self.site_data:
-            if any(kw in page['url'].lower() for kw in ['doc', 'guide', 'api', 'help']):
-                core_docs.append(page)
-            else:
-                optional_docs.append(page)
-
-        llms_txt = [
-            f"# {self.domain}",
-            "> AI-friendly documentation generated by LLMs.txt Generator\n"
-        ]
-
-        if core_docs:
-            llms_txt.append("## Core Documentation")
-            for doc in core_docs:
-                md_path = doc.get('md_path', doc['url'])  # Use correct md_path if available
-                md_url = f"{self.base_url.rstrip('/')}/{md_path}"
-                llms_txt.append(f"- [{doc['title']}]({md_url}): {doc['description']}")
-
-        if optional_docs:
-            llms_txt.append("\n## Optional")
-            for doc in optional_docs:
-                md_path = doc.get('md_path', doc['url'])  # Ensure correct path
-                md_url = f"{self.base_url.rstrip('/')}/{md_path}"
-                llms_txt.append(f"- [{doc['title']}]({md_url}): {doc['description']}")
-
-        # Generate llms-full.txt
-        llms_full = []
-        for doc in self.site_data:
-            md_path = os.path.join(self.output_dir, doc.get('md_path', doc['url']))
-            if os.path.exists(md_path):  # Ensure file exists before reading
-                with open(md_path, 'r', encoding='utf-8') as f:
-                    llms_full.append(f"# {doc['title']}\n\n{f.read()}\n\n---\n")
-
-        # Write output files
-        with open(os.path.join(self.output_dir, 'llms.txt'), 'w', encoding='utf-8') as f:
-            f.write('\n'.join(llms_txt))
-
-        with open(os.path.join(self.output_dir, 'llms-full.txt'), 'w', encoding='utf-8') as f:
-            f.write('\n'.join(llms_full))
+            # Classify pages for llms.txt
+            base = self.base_url  # Already stripped of its trailing slash
+            core_keywords = ('doc', 'guide', 'api', 'help')
+            core_docs = []
+            optional_docs = []
+            for page in self.site_data:
+                url = page['url'].lower()
+                entry = f"- [{page['title']}]({base}/{page['md_path']}): {page['description']}"
+                if any(kw in url for kw in core_keywords):
+                    core_docs.append(entry)
+                else:
+                    optional_docs.append(entry)
+
+            # Generate llms.txt
+            with open(os.path.join(self.output_dir, 'llms.txt'), 'w', encoding='utf-8') as f:
+                f.write(f"# {self.domain}\n")
+                f.write("> AI-friendly documentation generated by LLMs.txt Generator\n\n")
+
+                if core_docs:
+                    f.write("## Core Documentation\n")
+                    for entry in core_docs:
+                        f.write(entry + '\n')
+
+                if optional_docs:
+                    f.write("\n## Optional\n")
+                    for entry in optional_docs:
+                        f.write(entry + '\n')
+        finally:
+            self.session.close()
+            if self._md_cache is not None:
+                self._md_cache.close()
 
         print(f"\n✅ Success! Generated files in {self.output_dir}/")
         print("├── llms.txt")
@@ -206,6 +502,10 @@ if __name__ == "__main__":
     parser.add_argument('--ignore', nargs='+', help='Paths to ignore', default=[])
     parser.add_argument('--delay', type=float, default=1.0, 
                        help='Delay between requests (seconds)')
+    parser.add_argument('--workers', type=int, default=10,
+                       help='Number of pages fetched concurrently')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Disable the on-disk HTTP and markdown caches')
     
     args = parser.parse_args()
     
@@ -213,6 +513,8 @@ if __name__ == "__main__":
         base_url=args.url,
         output_dir=args.output,
         ignore_paths=args.ignore,
-        delay=args.delay
+        delay=args.delay,
+        workers=args.workers,
+        cache=not args.no_cache
     )
     generator.generate()
\ No newline at end of file